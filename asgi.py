@@ -0,0 +1,154 @@
+"""
+Modo ASGI do ALFA-TASK.
+
+As rotas de leitura mais acessadas (home, painéis de demandas, serviços,
+páginas de detalhe, anotações e a API GET) rodam direto no event loop, com um
+engine assíncrono do SQLAlchemy: asyncpg no PostgreSQL, aiosqlite no SQLite.
+As demais rotas (formulários, exportação, importação, SSE) seguem no app WSGI
+numa pool de threads.
+
+As views são as mesmas do app.py: a sessão de cada requisição assíncrona é
+um AsyncSession, e a view roda em AsyncSession.run_sync() com db.session
+apontando para ela. O código síncrono do ORM continua igual, mas cada ida ao
+banco devolve o event loop às outras requisições em vez de bloquear o worker.
+
+Uso:
+    uvicorn asgi:application --host 0.0.0.0 --port 8000 --workers 2
+    gunicorn -c gunicorn.conf.py -k uvicorn_worker.UvicornWorker asgi:application
+
+Variáveis de ambiente (além das do app.py, inclusive as DB_* do pool e a
+DATABASE_REPLICA_URL, que valem também para os engines assíncronos):
+    ASGI_WSGI_THREADS   threads para as rotas que continuam WSGI (padrão 10)
+
+A comparação com o gunicorn síncrono está em `python benchmark.py servidores`.
+"""
+import io
+import os
+import uuid
+
+from a2wsgi import WSGIMiddleware
+from a2wsgi.wsgi import build_environ
+from flask_sqlalchemy.query import Query
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+from werkzeug.exceptions import HTTPException
+
+from app import app, db, engine_options_for, wants_read_replica
+
+ASYNC_DRIVERS = {'postgresql': 'postgresql+asyncpg', 'sqlite': 'sqlite+aiosqlite'}
+
+# Endpoints servidos pelo engine assíncrono (somente GET/HEAD)
+ASYNC_ENDPOINTS = {
+    'home_page', 'dashboard', 'completed_demands', 'commission_tasks', 'commission_task_detail',
+    'demand_detail', 'notes', 'get_note_data', 'search',
+    'api_demands', 'api_completed_demands', 'api_demand_detail', 'api_demand_logs',
+    'api_commission_tasks', 'api_commission_task_detail', 'api_notes', 'api_note_detail',
+    'productivity_report', 'api_productivity_report',
+}
+
+
+def async_database_url(database_uri):
+    url = make_url(database_uri)
+    url = url.set(drivername=ASYNC_DRIVERS[url.get_backend_name()])
+    if url.get_backend_name() == 'postgresql' and 'sslmode' in url.query:
+        # asyncpg não conhece sslmode; o equivalente é o parâmetro ssl
+        url = url.update_query_dict({'ssl': url.query['sslmode']}).difference_update_query(['sslmode'])
+    return url
+
+
+def create_engine_for(database_uri):
+    url = async_database_url(database_uri)
+    options = engine_options_for(database_uri)
+    if url.get_backend_name() == 'postgresql' and options.get('poolclass') is NullPool:
+        # PgBouncer em modo transaction não mantém os prepared statements do asyncpg
+        options['connect_args'] = {'statement_cache_size': 0, 'prepared_statement_cache_size': 0,
+                                   'prepared_statement_name_func': lambda: f'__asyncpg_{uuid.uuid4()}__'}
+    return create_async_engine(url, **options)
+
+
+class AlfaTaskASGI:
+    def __init__(self, flask_app, engine, replica_engine=None, wsgi_threads=10):
+        self.flask_app = flask_app
+        self.engines = [engine] + ([replica_engine] if replica_engine is not None else [])
+        # Query do Flask-SQLAlchemy: as views usam .paginate() e get_or_404
+        self.sessions = async_sessionmaker(engine, query_cls=Query)
+        self.replica_sessions = async_sessionmaker(replica_engine, query_cls=Query) if replica_engine else None
+        self.wsgi = WSGIMiddleware(flask_app, workers=wsgi_threads)
+        self.url_adapter = flask_app.url_map.bind('localhost')
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self.lifespan(receive, send)
+        elif scope['type'] == 'http' and self.is_async_route(scope):
+            await self.handle_async(scope, receive, send)
+        else:
+            await self.wsgi(scope, receive, send)
+
+    def is_async_route(self, scope):
+        if scope['method'] not in ('GET', 'HEAD'):
+            return False
+        try:
+            endpoint, _ = self.url_adapter.match(scope['path'], method='GET')
+        except HTTPException:
+            return False
+        return endpoint in ASYNC_ENDPOINTS
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                for engine in self.engines:
+                    await engine.dispose()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def handle_async(self, scope, receive, send):
+        body = bytearray()
+        while True:
+            message = await receive()
+            body.extend(message.get('body', b''))
+            if not message.get('more_body'):
+                break
+        environ = build_environ(scope, io.BytesIO(bytes(body)))
+
+        context = self.flask_app.request_context(environ)
+        context.push()
+        error = None
+        try:
+            sessions = self.replica_sessions if self.replica_sessions and wants_read_replica() else self.sessions
+            async with sessions() as session:
+                db.session.registry.set(session.sync_session)
+                try:
+                    response = await session.run_sync(lambda _: self.dispatch())
+                finally:
+                    db.session.registry.clear()
+            status = response.status_code
+            headers = response.get_wsgi_headers(environ)
+            chunks = list(response.get_app_iter(environ))
+            response.close()
+        except Exception as exc:
+            error = exc
+            raise
+        finally:
+            context.pop(error)
+
+        await send({'type': 'http.response.start', 'status': status,
+                    'headers': [(name.lower().encode('latin1'), value.encode('latin1'))
+                                for name, value in headers.to_wsgi_list()]})
+        await send({'type': 'http.response.body', 'body': b''.join(chunks)})
+
+    def dispatch(self):
+        # Mesmo caminho do wsgi_app do Flask: before/after_request, erros e cookie de sessão
+        try:
+            return self.flask_app.full_dispatch_request()
+        except Exception as error:
+            return self.flask_app.handle_exception(error)
+
+
+replica = app.config.get('SQLALCHEMY_BINDS', {}).get('replica')
+application = AlfaTaskASGI(app, create_engine_for(app.config['SQLALCHEMY_DATABASE_URI']),
+                           replica_engine=create_engine_for(replica['url']) if replica else None,
+                           wsgi_threads=int(os.environ.get('ASGI_WSGI_THREADS', '10')))
@@ -0,0 +1,58 @@
+"""
+Configuração do gunicorn para o ALFA-TASK.
+
+    gunicorn app:app
+    GUNICORN_WORKER_CLASS=uvicorn_worker.UvicornWorker gunicorn asgi:application
+
+Por padrão usa workers gevent: as conexões SSE (/events) ficam abertas
+esperando eventos e, com worker síncrono, cada uma prenderia um worker
+inteiro. Com gevent cada conexão é uma greenlet e o psycopg2 é tornado
+cooperativo (psycogreen) para as consultas não travarem o worker.
+
+No modo ASGI (asgi.py) o worker é o do uvicorn: as leituras usam o engine
+assíncrono e o resto roda numa pool de threads, sem gevent.
+
+Variáveis de ambiente:
+    PORT                         porta (padrão 8000)
+    WEB_CONCURRENCY              processos (padrão 2; sempre 1 com PUSH_BACKEND=memory)
+    GUNICORN_WORKER_CLASS        gevent (padrão), sync ou uvicorn_worker.UvicornWorker
+    GUNICORN_WORKER_CONNECTIONS  conexões simultâneas por worker gevent (padrão 1000)
+    GUNICORN_TIMEOUT             segundos (padrão 60)
+
+Os eventos das demandas (SSE) usam PUSH_BACKEND=postgres por padrão no
+PostgreSQL e chegam às conexões de todos os workers. Com PUSH_BACKEND=memory
+(SQLite, PgBouncer em modo transaction ou definido à mão) cada processo só
+entrega o que ele mesmo gravou, então WEB_CONCURRENCY é ignorado e sobe um
+processo só.
+
+Importações e exportações enviadas com async=1/POST viram tarefas na fila do
+banco: rode `flask worker` num processo (ou serviço) à parte para executá-las.
+Os arquivos enviados e gerados também ficam no banco, então o worker não
+precisa de disco compartilhado com o app.
+"""
+import os
+
+
+def push_backend():
+    """PUSH_BACKEND efetivo, pela mesma regra de default_push_backend() no app.py."""
+    database_url = os.environ.get('DATABASE_URL') or 'postgresql://'
+    if database_url.startswith(('postgres://', 'postgresql')) and os.environ.get('DB_PGBOUNCER', '0') != '1':
+        default = 'postgres'
+    else:
+        default = 'memory'
+    return os.environ.get('PUSH_BACKEND') or default
+
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = 1 if push_backend() == 'memory' else int(os.environ.get('WEB_CONCURRENCY', '2'))
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gevent')
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', '1000'))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', '60'))
+graceful_timeout = 10
+accesslog = '-'
+
+
+def post_fork(server, worker):
+    if server.cfg.worker_class_str == 'gevent':
+        from psycogreen.gevent import patch_psycopg
+        patch_psycopg()
@@ -0,0 +1,62 @@
+"""Índices compostos para filtros e ordenação
+
+Revision ID: 0d61b2cebda1
+Revises: b312985558bf
+Create Date: 2026-10-17 10:02:18.447120
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0d61b2cebda1'
+down_revision = 'b312985558bf'
+branch_labels = None
+depends_on = None
+
+
+OPEN_DEMANDS = sa.text("status <> 'CONCLUIDO'")
+
+
+def upgrade():
+    with op.batch_alter_table('demands', schema=None) as batch_op:
+        batch_op.create_index('ix_demands_status_created_at', ['status', 'created_at', 'id'], unique=False)
+        batch_op.create_index('ix_demands_assigned_status_created_at', ['assigned_to_id', 'status', 'created_at'], unique=False)
+        batch_op.create_index('ix_demands_open_created_at', ['created_at', 'id'], unique=False,
+                              postgresql_where=OPEN_DEMANDS, sqlite_where=OPEN_DEMANDS)
+
+    with op.batch_alter_table('commission_tasks', schema=None) as batch_op:
+        batch_op.create_index('ix_commission_tasks_date_completed', ['date_completed', 'id'], unique=False)
+        batch_op.create_index('ix_commission_tasks_technician_date', ['technician_id', 'date_completed', 'id'], unique=False)
+        batch_op.create_index('ix_commission_tasks_type_date', ['service_type', 'date_completed'], unique=False)
+
+    with op.batch_alter_table('custom_service_items', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_custom_service_items_commission_task_id'), ['commission_task_id'], unique=False)
+
+    with op.batch_alter_table('demand_logs', schema=None) as batch_op:
+        batch_op.create_index('ix_demand_logs_demand_timestamp', ['demand_id', 'timestamp'], unique=False)
+
+    with op.batch_alter_table('notes', schema=None) as batch_op:
+        batch_op.create_index('ix_notes_user_created_at', ['user_id', 'created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('notes', schema=None) as batch_op:
+        batch_op.drop_index('ix_notes_user_created_at')
+
+    with op.batch_alter_table('demand_logs', schema=None) as batch_op:
+        batch_op.drop_index('ix_demand_logs_demand_timestamp')
+
+    with op.batch_alter_table('custom_service_items', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_custom_service_items_commission_task_id'))
+
+    with op.batch_alter_table('commission_tasks', schema=None) as batch_op:
+        batch_op.drop_index('ix_commission_tasks_type_date')
+        batch_op.drop_index('ix_commission_tasks_technician_date')
+        batch_op.drop_index('ix_commission_tasks_date_completed')
+
+    with op.batch_alter_table('demands', schema=None) as batch_op:
+        batch_op.drop_index('ix_demands_open_created_at')
+        batch_op.drop_index('ix_demands_assigned_status_created_at')
+        batch_op.drop_index('ix_demands_status_created_at')
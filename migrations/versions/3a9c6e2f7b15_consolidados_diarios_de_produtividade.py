@@ -0,0 +1,93 @@
+"""Consolidados diários de produtividade
+
+Revision ID: 3a9c6e2f7b15
+Revises: 8e3b5d9a1c27
+Create Date: 2026-10-17 21:05:42.318870
+
+"""
+from datetime import datetime
+
+from alembic import op
+import pytz
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3a9c6e2f7b15'
+down_revision = '8e3b5d9a1c27'
+branch_labels = None
+depends_on = None
+
+LOCAL_TIMEZONE = pytz.timezone('America/Sao_Paulo')
+
+
+def _local_date(value):
+    if not value:
+        return None
+    return pytz.utc.localize(datetime.fromisoformat(value)).astimezone(LOCAL_TIMEZONE).date().isoformat()
+
+
+def local_day(column):
+    # Dia de Brasília, como no app: as datas são gravadas em UTC
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        return f"date(({column} AT TIME ZONE 'UTC') AT TIME ZONE '{LOCAL_TIMEZONE.zone}')"
+    bind.connection.driver_connection.create_function('local_date', 1, _local_date, deterministic=True)
+    return f"local_date({column})"
+
+
+def upgrade():
+    op.create_table('daily_task_rollups',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('technician_id', sa.Integer(), nullable=False),
+    sa.Column('service_type', sa.String(length=50), nullable=False),
+    sa.Column('task_count', sa.Integer(), nullable=False),
+    sa.Column('total_weight', sa.Integer(), nullable=False),
+    sa.Column('commission_value', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.ForeignKeyConstraint(['technician_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('daily_task_rollups', schema=None) as batch_op:
+        batch_op.create_index('ix_daily_task_rollups_day_technician', ['day', 'technician_id', 'service_type'], unique=True)
+
+    op.create_table('daily_demand_rollups',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('status', sa.String(length=50), nullable=False),
+    sa.Column('transitions', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('daily_demand_rollups', schema=None) as batch_op:
+        # user_id nulo entra como 0: NULL não conflitaria no índice único (ON CONFLICT do app)
+        batch_op.create_index('ix_daily_demand_rollups_day_status', ['day', 'status', sa.text('coalesce(user_id, 0)')], unique=True)
+
+    # --- Backfill: mesmo cálculo de rebuild_rollups() no app ---
+    task_day = local_day('date_completed')
+    op.execute(
+        "INSERT INTO daily_task_rollups (day, technician_id, service_type, task_count, total_weight, commission_value) "
+        f"SELECT {task_day}, technician_id, service_type, count(*), coalesce(sum(total_weight), 0), "
+        "coalesce(sum(commission_value), 0) FROM commission_tasks "
+        f"GROUP BY {task_day}, technician_id, service_type"
+    )
+    transition_day = local_day('at')
+    op.execute(
+        "INSERT INTO daily_demand_rollups (day, user_id, status, transitions) "
+        f"SELECT {transition_day}, user_id, to_status, count(*) FROM ("
+        "SELECT at, user_id, to_status FROM demand_status_transitions "
+        "UNION ALL SELECT at, user_id, to_status FROM archived_demand_status_transitions) AS transitions "
+        f"GROUP BY {transition_day}, user_id, to_status"
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('daily_demand_rollups', schema=None) as batch_op:
+        batch_op.drop_index('ix_daily_demand_rollups_day_status')
+
+    op.drop_table('daily_demand_rollups')
+    with op.batch_alter_table('daily_task_rollups', schema=None) as batch_op:
+        batch_op.drop_index('ix_daily_task_rollups_day_technician')
+
+    op.drop_table('daily_task_rollups')
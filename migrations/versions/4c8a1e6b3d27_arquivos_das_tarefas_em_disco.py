@@ -0,0 +1,39 @@
+"""Arquivos das tarefas em disco (JOBS_STORAGE_DIR), só a referência no banco
+
+Revision ID: 4c8a1e6b3d27
+Revises: 9b7e2c4d5f60
+Create Date: 2026-10-18 11:03:52.661248
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4c8a1e6b3d27'
+down_revision = '9b7e2c4d5f60'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Os arquivos gravados no banco não são levados para o disco: tarefas ainda não
+    # executadas que dependiam de um arquivo enviado são encerradas como falha
+    op.execute(
+        "UPDATE jobs SET status = 'falhou', finished_at = CURRENT_TIMESTAMP, "
+        "error = 'Arquivo descartado na atualização do sistema: envie de novo.' "
+        "WHERE status IN ('pendente', 'executando') AND id IN (SELECT job_id FROM job_files)"
+    )
+    op.execute("DELETE FROM job_files")
+    with op.batch_alter_table('job_files', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('storage_name', sa.String(length=255), nullable=False))
+        batch_op.add_column(sa.Column('size', sa.BigInteger(), nullable=False))
+        batch_op.drop_column('data')
+
+
+def downgrade():
+    op.execute("DELETE FROM job_files")
+    with op.batch_alter_table('job_files', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('data', sa.LargeBinary(), nullable=False))
+        batch_op.drop_column('size')
+        batch_op.drop_column('storage_name')
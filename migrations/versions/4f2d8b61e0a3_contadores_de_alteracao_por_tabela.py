@@ -0,0 +1,33 @@
+"""Contadores de alteração por tabela (validadores da API)
+
+Revision ID: 4f2d8b61e0a3
+Revises: c7a43e0b9f18
+Create Date: 2026-10-17 16:03:27.551804
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from datetime import datetime
+
+
+# revision identifiers, used by Alembic.
+revision = '4f2d8b61e0a3'
+down_revision = 'c7a43e0b9f18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    table_versions = op.create_table('table_versions',
+    sa.Column('name', sa.String(length=64), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('changed_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('name')
+    )
+    now = datetime.utcnow()
+    op.bulk_insert(table_versions, [{'name': name, 'version': 1, 'changed_at': now}
+                                    for name in ['demands', 'demand_logs', 'commission_tasks', 'notes']])
+
+
+def downgrade():
+    op.drop_table('table_versions')
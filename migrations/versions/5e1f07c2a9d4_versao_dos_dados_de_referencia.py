@@ -0,0 +1,29 @@
+"""Versão dos dados de referência (usuários e serviços)
+
+Revision ID: 5e1f07c2a9d4
+Revises: 99a7ba2c33c5
+Create Date: 2026-10-17 14:05:31.402117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e1f07c2a9d4'
+down_revision = '99a7ba2c33c5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    reference_data_version = op.create_table('reference_data_version',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.bulk_insert(reference_data_version, [{'id': 1, 'version': 1}])
+
+
+def downgrade():
+    op.drop_table('reference_data_version')
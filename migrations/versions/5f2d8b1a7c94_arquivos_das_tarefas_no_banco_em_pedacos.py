@@ -0,0 +1,43 @@
+"""Arquivos das tarefas no banco, em pedaços (job_file_chunks)
+
+Revision ID: 5f2d8b1a7c94
+Revises: 4c8a1e6b3d27
+Create Date: 2026-10-18 15:27:09.114530
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5f2d8b1a7c94'
+down_revision = '4c8a1e6b3d27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('job_file_chunks',
+    sa.Column('file_id', sa.Integer(), nullable=False),
+    sa.Column('seq', sa.Integer(), nullable=False),
+    sa.Column('data', sa.LargeBinary(), nullable=False),
+    sa.ForeignKeyConstraint(['file_id'], ['job_files.id'], ),
+    sa.PrimaryKeyConstraint('file_id', 'seq')
+    )
+    # Os arquivos do diretório local não são trazidos para o banco: tarefas ainda não
+    # executadas que dependiam de um arquivo enviado são encerradas como falha
+    op.execute(
+        "UPDATE jobs SET status = 'falhou', finished_at = CURRENT_TIMESTAMP, "
+        "error = 'Arquivo descartado na atualização do sistema: envie de novo.' "
+        "WHERE status IN ('pendente', 'executando') AND id IN (SELECT job_id FROM job_files)"
+    )
+    op.execute("DELETE FROM job_files")
+    with op.batch_alter_table('job_files', schema=None) as batch_op:
+        batch_op.drop_column('storage_name')
+
+
+def downgrade():
+    op.drop_table('job_file_chunks')
+    op.execute("DELETE FROM job_files")
+    with op.batch_alter_table('job_files', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('storage_name', sa.String(length=255), nullable=False))
@@ -0,0 +1,63 @@
+"""Fila de tarefas em segundo plano
+
+Revision ID: 6d1f4a8c2e93
+Revises: 3a9c6e2f7b15
+Create Date: 2026-10-17 22:48:19.540216
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6d1f4a8c2e93'
+down_revision = '3a9c6e2f7b15'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('jobs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('kind', sa.String(length=50), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('payload', sa.Text(), nullable=False),
+    sa.Column('result', sa.Text(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('max_attempts', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('run_at', sa.DateTime(), nullable=False),
+    sa.Column('locked_at', sa.DateTime(), nullable=True),
+    sa.Column('locked_by', sa.String(length=120), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('jobs', schema=None) as batch_op:
+        batch_op.create_index('ix_jobs_status_run_at', ['status', 'run_at'], unique=False)
+
+    op.create_table('job_files',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('job_id', sa.Integer(), nullable=False),
+    sa.Column('kind', sa.String(length=10), nullable=False),
+    sa.Column('filename', sa.String(length=255), nullable=False),
+    sa.Column('content_type', sa.String(length=100), nullable=False),
+    sa.Column('data', sa.LargeBinary(), nullable=False),
+    sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('job_files', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_job_files_job_id'), ['job_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('job_files', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_job_files_job_id'))
+
+    op.drop_table('job_files')
+    with op.batch_alter_table('jobs', schema=None) as batch_op:
+        batch_op.drop_index('ix_jobs_status_run_at')
+
+    op.drop_table('jobs')
@@ -0,0 +1,105 @@
+"""Arquivo de demandas concluídas (tabelas frias)
+
+Revision ID: 8e3b5d9a1c27
+Revises: 4f2d8b61e0a3
+Create Date: 2026-10-17 19:41:08.126503
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8e3b5d9a1c27'
+down_revision = '4f2d8b61e0a3'
+branch_labels = None
+depends_on = None
+
+
+# Busca textual das tabelas arquivadas: mesmo SQL de ARCHIVE_SEARCH_DDL no app.
+# No PostgreSQL as funções de vetor são as de demands/demand_logs (c7a43e0b9f18).
+SEARCH_TABLES = {'archived_demands': ('demands', ['title', 'description']),
+                 'archived_demand_logs': ('demand_logs', ['action'])}
+
+
+def upgrade():
+    op.create_table('archived_demands',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('title', sa.String(length=120), nullable=False),
+    sa.Column('description', sa.Text(), nullable=False),
+    sa.Column('priority', sa.String(length=20), nullable=False),
+    sa.Column('status', sa.String(length=50), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('requester_id', sa.Integer(), nullable=False),
+    sa.Column('assigned_to_id', sa.Integer(), nullable=True),
+    sa.Column('status_changed_at', sa.DateTime(), nullable=True),
+    sa.Column('lead_time_seconds', sa.Integer(), nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['assigned_to_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['requester_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('archived_demands', schema=None) as batch_op:
+        batch_op.create_index('ix_archived_demands_assigned_created_at', ['assigned_to_id', 'created_at'], unique=False)
+        batch_op.create_index('ix_archived_demands_created_at', ['created_at', 'id'], unique=False)
+
+    op.create_table('archived_demand_logs',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('demand_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('action', sa.Text(), nullable=False),
+    sa.Column('timestamp', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('archived_demand_logs', schema=None) as batch_op:
+        batch_op.create_index('ix_archived_demand_logs_demand_timestamp', ['demand_id', 'timestamp'], unique=False)
+
+    op.create_table('archived_demand_status_transitions',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('demand_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('from_status', sa.String(length=50), nullable=True),
+    sa.Column('to_status', sa.String(length=50), nullable=False),
+    sa.Column('at', sa.DateTime(), nullable=False),
+    sa.Column('duration_seconds', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('archived_demand_status_transitions', schema=None) as batch_op:
+        batch_op.create_index('ix_archived_demand_status_transitions_demand_at', ['demand_id', 'at'], unique=False)
+
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        for table, (source, columns) in SEARCH_TABLES.items():
+            op.execute(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_vector tsvector")
+            op.execute(f"CREATE TRIGGER search_{table}_trigger BEFORE INSERT OR UPDATE OF {', '.join(columns)} ON {table} "
+                       f"FOR EACH ROW EXECUTE PROCEDURE search_{source}_vector()")
+            op.execute(f"CREATE INDEX IF NOT EXISTS search_{table}_vector_idx ON {table} USING gin (search_vector)")
+    elif dialect == 'sqlite':
+        for table, (_, columns) in SEARCH_TABLES.items():
+            column_list = ', '.join(columns)
+            new_values = ', '.join(f'new.{column}' for column in columns)
+            old_values = ', '.join(f'old.{column}' for column in columns)
+            fts = f'search_{table}'
+            delete_old = f"INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.id, {old_values});"
+            insert_new = f"INSERT INTO {fts}(rowid, {column_list}) VALUES (new.id, {new_values});"
+            op.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({column_list}, content='{table}', "
+                       f"content_rowid='id', tokenize='unicode61 remove_diacritics 2')")
+            op.execute(f"CREATE TRIGGER IF NOT EXISTS {fts}_insert AFTER INSERT ON {table} BEGIN {insert_new} END")
+            op.execute(f"CREATE TRIGGER IF NOT EXISTS {fts}_delete AFTER DELETE ON {table} BEGIN {delete_old} END")
+            op.execute(f"CREATE TRIGGER IF NOT EXISTS {fts}_update AFTER UPDATE OF {column_list} ON {table} "
+                       f"BEGIN {delete_old} {insert_new} END")
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'sqlite':
+        for table in SEARCH_TABLES:
+            for suffix in ('insert', 'delete', 'update'):
+                op.execute(f"DROP TRIGGER IF EXISTS search_{table}_{suffix}")
+            op.execute(f"DROP TABLE IF EXISTS search_{table}")
+
+    # Triggers, índices GIN e partições mensais (flask partition-archive) caem junto com as tabelas
+    op.drop_table('archived_demand_status_transitions')
+    op.drop_table('archived_demand_logs')
+    op.drop_table('archived_demands')
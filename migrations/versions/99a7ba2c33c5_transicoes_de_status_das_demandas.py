@@ -0,0 +1,102 @@
+"""Transições de status das demandas
+
+Revision ID: 99a7ba2c33c5
+Revises: 0d61b2cebda1
+Create Date: 2026-10-17 11:20:05.731954
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import re
+from datetime import datetime
+
+
+# revision identifiers, used by Alembic.
+revision = '99a7ba2c33c5'
+down_revision = '0d61b2cebda1'
+branch_labels = None
+depends_on = None
+
+
+STATUS_LOG = re.compile(r"^Status alterado de '(.*?)' para '(.*?)'")
+
+
+def upgrade():
+    op.create_table('demand_status_transitions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('demand_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('from_status', sa.String(length=50), nullable=True),
+    sa.Column('to_status', sa.String(length=50), nullable=False),
+    sa.Column('at', sa.DateTime(), nullable=False),
+    sa.Column('duration_seconds', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['demand_id'], ['demands.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('demand_status_transitions', schema=None) as batch_op:
+        batch_op.create_index('ix_demand_status_transitions_demand_at', ['demand_id', 'at'], unique=False)
+        batch_op.create_index('ix_demand_status_transitions_from_status', ['from_status', 'duration_seconds'], unique=False)
+
+    with op.batch_alter_table('demands', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('status_changed_at', sa.DateTime(), nullable=True))
+        batch_op.add_column(sa.Column('lead_time_seconds', sa.Integer(), nullable=True))
+
+    # --- Backfill: reconstrói as transições a partir do texto de demand_logs (uma única vez) ---
+    conn = op.get_bind()
+    demands = conn.execute(sa.text("SELECT id, status, created_at, requester_id FROM demands")).fetchall()
+    logs_by_demand = {}
+    for demand_id, user_id, action, timestamp in conn.execute(sa.text(
+        "SELECT demand_id, user_id, action, timestamp FROM demand_logs "
+        "WHERE action LIKE 'Status alterado de %' ORDER BY demand_id, timestamp, id"
+    )):
+        match = STATUS_LOG.match(action)
+        if match:
+            logs_by_demand.setdefault(demand_id, []).append((user_id, match.group(1), match.group(2), timestamp))
+
+    transitions, demand_updates = [], []
+    for demand_id, status, created_at, requester_id in demands:
+        created_at = _as_datetime(created_at)
+        changes = logs_by_demand.get(demand_id, [])
+        initial_status = changes[0][1] if changes else status
+        transitions.append({'demand_id': demand_id, 'user_id': requester_id, 'from_status': None,
+                            'to_status': initial_status, 'at': created_at, 'duration_seconds': 0})
+        previous_at, lead_time = created_at, None
+        for user_id, from_status, to_status, at in changes:
+            at = _as_datetime(at)
+            transitions.append({'demand_id': demand_id, 'user_id': user_id, 'from_status': from_status,
+                                'to_status': to_status, 'at': at,
+                                'duration_seconds': max(int((at - previous_at).total_seconds()), 0)})
+            previous_at = at
+            lead_time = int((at - created_at).total_seconds()) if to_status == 'CONCLUIDO' else None
+        if status == 'CONCLUIDO' and lead_time is None:
+            lead_time = int((previous_at - created_at).total_seconds())
+        demand_updates.append({'id': demand_id, 'changed_at': previous_at, 'lead_time': lead_time})
+
+    transitions_table = sa.table('demand_status_transitions',
+        sa.column('demand_id'), sa.column('user_id'), sa.column('from_status'),
+        sa.column('to_status'), sa.column('at', sa.DateTime), sa.column('duration_seconds'))
+    for start in range(0, len(transitions), 5000):
+        op.bulk_insert(transitions_table, transitions[start:start + 5000])
+    if demand_updates:
+        conn.execute(sa.text("UPDATE demands SET status_changed_at = :changed_at, lead_time_seconds = :lead_time WHERE id = :id"),
+                     demand_updates)
+
+
+def _as_datetime(value):
+    # SQLite devolve DATETIME como texto em SQL puro
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return value
+
+
+def downgrade():
+    with op.batch_alter_table('demands', schema=None) as batch_op:
+        batch_op.drop_column('lead_time_seconds')
+        batch_op.drop_column('status_changed_at')
+
+    with op.batch_alter_table('demand_status_transitions', schema=None) as batch_op:
+        batch_op.drop_index('ix_demand_status_transitions_from_status')
+        batch_op.drop_index('ix_demand_status_transitions_demand_at')
+
+    op.drop_table('demand_status_transitions')
@@ -0,0 +1,60 @@
+"""Ids sem reúso nas tabelas arquiváveis (AUTOINCREMENT no SQLite)
+
+Revision ID: 9b7e2c4d5f60
+Revises: 6d1f4a8c2e93
+Create Date: 2026-10-18 10:12:37.904415
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9b7e2c4d5f60'
+down_revision = '6d1f4a8c2e93'
+branch_labels = None
+depends_on = None
+
+
+# Tabela ativa -> arquivada. Sem AUTOINCREMENT o SQLite reaproveita o maior id apagado,
+# que pode já existir na tabela arquivada. O PostgreSQL usa sequências, que não reaproveitam.
+ARCHIVABLE_TABLES = {'demands': 'archived_demands', 'demand_logs': 'archived_demand_logs',
+                     'demand_status_transitions': 'archived_demand_status_transitions'}
+# A recriação da tabela descarta os triggers da busca textual (c7a43e0b9f18)
+SEARCH_TABLES = {'demands': ['title', 'description'], 'demand_logs': ['action']}
+
+
+def recreate_search_triggers():
+    for table, columns in SEARCH_TABLES.items():
+        column_list = ', '.join(columns)
+        new_values = ', '.join(f'new.{column}' for column in columns)
+        old_values = ', '.join(f'old.{column}' for column in columns)
+        fts = f'search_{table}'
+        delete_old = f"INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.id, {old_values});"
+        insert_new = f"INSERT INTO {fts}(rowid, {column_list}) VALUES (new.id, {new_values});"
+        op.execute(f"CREATE TRIGGER IF NOT EXISTS {fts}_insert AFTER INSERT ON {table} BEGIN {insert_new} END")
+        op.execute(f"CREATE TRIGGER IF NOT EXISTS {fts}_delete AFTER DELETE ON {table} BEGIN {delete_old} END")
+        op.execute(f"CREATE TRIGGER IF NOT EXISTS {fts}_update AFTER UPDATE OF {column_list} ON {table} "
+                   f"BEGIN {delete_old} {insert_new} END")
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for table, archived in ARCHIVABLE_TABLES.items():
+        with op.batch_alter_table(table, recreate='always', table_kwargs={'sqlite_autoincrement': True}):
+            pass
+        # Os próximos ids começam depois do maior já usado, inclusive pelos arquivados
+        op.execute(f"DELETE FROM sqlite_sequence WHERE name = '{table}'")
+        op.execute(f"INSERT INTO sqlite_sequence (name, seq) SELECT '{table}', max(id) FROM "
+                   f"(SELECT coalesce(max(id), 0) AS id FROM {table} UNION ALL SELECT coalesce(max(id), 0) FROM {archived})")
+    recreate_search_triggers()
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for table in ARCHIVABLE_TABLES:
+        with op.batch_alter_table(table, recreate='always', table_kwargs={'sqlite_autoincrement': False}):
+            pass
+    recreate_search_triggers()
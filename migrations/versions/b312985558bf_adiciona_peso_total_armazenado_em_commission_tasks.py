@@ -0,0 +1,66 @@
+"""Adiciona peso total armazenado em commission_tasks
+
+Revision ID: b312985558bf
+Revises: 2bab3775c949
+Create Date: 2026-10-17 09:12:40.118342
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import math
+
+
+# revision identifiers, used by Alembic.
+revision = 'b312985558bf'
+down_revision = '2bab3775c949'
+branch_labels = None
+depends_on = None
+
+
+HIGH_WEIGHT_ITEMS = ['Impressora G', 'PC Gamer', 'Notebook', 'Servidor', 'All in one', 'Nobreak']
+
+
+def _budget_weight(description):
+    if not description:
+        return 0
+    equipments_line = description.split('\n\n')[0].replace('Equipamentos Orçados: ', '').strip()
+    equipments = [eq.strip() for eq in equipments_line.split(',')]
+    return sum(2 if eq in HIGH_WEIGHT_ITEMS else 1 for eq in equipments)
+
+
+def upgrade():
+    with op.batch_alter_table('commission_tasks', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('total_weight', sa.Integer(), server_default='0', nullable=False))
+        batch_op.create_index('ix_commission_tasks_technician_weight', ['technician_id', 'total_weight'], unique=False)
+
+    # --- Backfill: mesma regra de CommissionTask.calculate_total_weight() ---
+    conn = op.get_bind()
+    conn.execute(sa.text("""
+        UPDATE commission_tasks SET total_weight =
+            COALESCE((SELECT SUM(ps.weight) FROM task_services_association tsa
+                      JOIN predefined_services ps ON ps.id = tsa.predefined_service_id
+                      WHERE tsa.commission_task_id = commission_tasks.id), 0)
+          + COALESCE((SELECT SUM(csi.weight) FROM custom_service_items csi
+                      WHERE csi.commission_task_id = commission_tasks.id), 0)
+        WHERE service_type = 'Serviço'
+    """))
+
+    rows = conn.execute(sa.text(
+        "SELECT id, service_type, description, commission_value FROM commission_tasks "
+        "WHERE service_type IN ('Orçamento', 'Venda')"
+    )).fetchall()
+    updates = []
+    for task_id, service_type, description, commission_value in rows:
+        if service_type == 'Orçamento':
+            weight = _budget_weight(description)
+        else:
+            weight = int(math.ceil(commission_value / 500)) if commission_value else 0
+        updates.append({'id': task_id, 'weight': weight})
+    if updates:
+        conn.execute(sa.text("UPDATE commission_tasks SET total_weight = :weight WHERE id = :id"), updates)
+
+
+def downgrade():
+    with op.batch_alter_table('commission_tasks', schema=None) as batch_op:
+        batch_op.drop_index('ix_commission_tasks_technician_weight')
+        batch_op.drop_column('total_weight')
@@ -0,0 +1,97 @@
+"""Busca textual em demandas, histórico e anotações
+
+Revision ID: c7a43e0b9f18
+Revises: 5e1f07c2a9d4
+Create Date: 2026-10-17 15:12:44.906231
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7a43e0b9f18'
+down_revision = '5e1f07c2a9d4'
+branch_labels = None
+depends_on = None
+
+
+# Mesmo SQL de install_search_index() no app; as estruturas têm prefixo "search_"
+# e ficam fora do autogenerate. Colunas indexadas de cada tabela:
+SEARCH_TABLES = {'demands': ['title', 'description'], 'demand_logs': ['action'], 'notes': ['title', 'content']}
+
+POSTGRES_VECTORS = {
+    'demands': "setweight(to_tsvector('portuguese_unaccent', coalesce(NEW.title, '')), 'A') "
+               "|| setweight(to_tsvector('portuguese_unaccent', coalesce(NEW.description, '')), 'B')",
+    'demand_logs': "to_tsvector('portuguese_unaccent', coalesce(NEW.action, ''))",
+    'notes': "setweight(to_tsvector('portuguese_unaccent', coalesce(NEW.title, '')), 'A') "
+             "|| setweight(to_tsvector('portuguese_unaccent', "
+             "regexp_replace(coalesce(NEW.content, ''), '<[^>]*>', ' ', 'g')), 'B')",
+}
+
+
+def _upgrade_postgresql():
+    op.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+    op.execute("""DO $$ BEGIN
+        IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'portuguese_unaccent') THEN
+            CREATE TEXT SEARCH CONFIGURATION portuguese_unaccent (COPY = portuguese);
+            ALTER TEXT SEARCH CONFIGURATION portuguese_unaccent
+                ALTER MAPPING FOR hword, hword_part, word WITH unaccent, portuguese_stem;
+        END IF;
+    END $$""")
+    for table, columns in SEARCH_TABLES.items():
+        op.execute(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_vector tsvector")
+        op.execute(f"""CREATE OR REPLACE FUNCTION search_{table}_vector() RETURNS trigger AS $$ BEGIN
+            NEW.search_vector := {POSTGRES_VECTORS[table]};
+            RETURN NEW;
+        END $$ LANGUAGE plpgsql""")
+        op.execute(f"DROP TRIGGER IF EXISTS search_{table}_trigger ON {table}")
+        op.execute(f"CREATE TRIGGER search_{table}_trigger BEFORE INSERT OR UPDATE OF {', '.join(columns)} ON {table} "
+                   f"FOR EACH ROW EXECUTE PROCEDURE search_{table}_vector()")
+        # Preenche as linhas existentes disparando o trigger
+        op.execute(f"UPDATE {table} SET {columns[0]} = {columns[0]}")
+        op.execute(f"CREATE INDEX IF NOT EXISTS search_{table}_vector_idx ON {table} USING gin (search_vector)")
+    op.execute("CREATE INDEX IF NOT EXISTS search_commission_tasks_os_idx "
+               "ON commission_tasks (external_os_number varchar_pattern_ops)")
+
+
+def _upgrade_sqlite():
+    for table, columns in SEARCH_TABLES.items():
+        column_list = ', '.join(columns)
+        new_values = ', '.join(f'new.{column}' for column in columns)
+        old_values = ', '.join(f'old.{column}' for column in columns)
+        fts = f'search_{table}'
+        delete_old = f"INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.id, {old_values});"
+        insert_new = f"INSERT INTO {fts}(rowid, {column_list}) VALUES (new.id, {new_values});"
+        op.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({column_list}, content='{table}', "
+                   f"content_rowid='id', tokenize='unicode61 remove_diacritics 2')")
+        op.execute(f"CREATE TRIGGER IF NOT EXISTS {fts}_insert AFTER INSERT ON {table} BEGIN {insert_new} END")
+        op.execute(f"CREATE TRIGGER IF NOT EXISTS {fts}_delete AFTER DELETE ON {table} BEGIN {delete_old} END")
+        op.execute(f"CREATE TRIGGER IF NOT EXISTS {fts}_update AFTER UPDATE OF {column_list} ON {table} "
+                   f"BEGIN {delete_old} {insert_new} END")
+        op.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        _upgrade_postgresql()
+    elif dialect == 'sqlite':
+        _upgrade_sqlite()
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS search_commission_tasks_os_idx")
+        for table in SEARCH_TABLES:
+            op.execute(f"DROP TRIGGER IF EXISTS search_{table}_trigger ON {table}")
+            op.execute(f"DROP FUNCTION IF EXISTS search_{table}_vector()")
+            op.execute(f"DROP INDEX IF EXISTS search_{table}_vector_idx")
+            op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector")
+        op.execute("DROP TEXT SEARCH CONFIGURATION IF EXISTS portuguese_unaccent")
+    elif dialect == 'sqlite':
+        for table in SEARCH_TABLES:
+            for suffix in ('insert', 'delete', 'update'):
+                op.execute(f"DROP TRIGGER IF EXISTS search_{table}_{suffix}")
+            op.execute(f"DROP TABLE IF EXISTS search_{table}")
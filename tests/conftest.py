@@ -0,0 +1,55 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# O app lê a configuração do ambiente ao ser importado: banco SQLite temporário
+# e hash de senha barato, para os testes não gastarem tempo no scrypt.
+_db_dir = tempfile.mkdtemp(prefix='alfatask-tests-')
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(_db_dir, 'test.db')}"
+os.environ['PASSWORD_HASH_METHOD'] = 'pbkdf2:sha256:1000'
+os.environ['PUSH_BACKEND'] = 'off'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as alfa  # noqa: E402
+
+PASSWORD = 'senha'
+USERS = [('gerente', 'Gerente'), ('tecnico', 'Técnico'), ('tecnico2', 'Técnico')]
+
+
+@pytest.fixture(scope='session')
+def app():
+    alfa.app.config['TESTING'] = True
+    with alfa.app.app_context():
+        alfa.db.create_all()
+        for username, role in USERS:
+            user = alfa.User(username=username, role=role)
+            user.set_password(PASSWORD)
+            alfa.db.session.add(user)
+        alfa.db.session.commit()
+        alfa.app.test_cli_runner().invoke(args=['seed-services'])
+    yield alfa.app
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def login(client):
+    def login_as(username):
+        client.get('/logout')
+        response = client.post('/login', data={'username': username, 'password': PASSWORD})
+        assert response.status_code == 302
+        return client
+    return login_as
+
+
+@pytest.fixture
+def user_id(app):
+    def find(username):
+        with app.app_context():
+            return alfa.User.query.filter_by(username=username).one().id
+    return find
@@ -0,0 +1,42 @@
+"""
+O arquivo de demandas mantém os ids: um id arquivado nunca pode voltar a ser
+usado em `demands` (nem no histórico e nas transições).
+"""
+from datetime import datetime, timedelta
+
+import app as alfa
+
+
+def create_demand(client, title):
+    client.post('/demand/create', data={'title': title, 'description': 'Arquivo', 'priority': 'Normal'})
+    with alfa.app.app_context():
+        return alfa.db.session.scalar(alfa.db.select(alfa.func.max(alfa.Demand.id)))
+
+
+def archive_all(app):
+    with app.app_context():
+        return alfa.archive_completed_demands(0, now=datetime.utcnow() + timedelta(days=1))
+
+
+def test_archive_after_deleting_newest_demand(app, login):
+    client = login('gerente')
+    completed = create_demand(client, 'Concluída')
+    client.post(f'/demand/{completed}/status', data={'status': 'CONCLUIDO'})
+    newest = create_demand(client, 'Apagada')
+    client.post(f'/demand/{newest}/delete')
+
+    assert archive_all(app) >= 1
+    created = create_demand(client, 'Nova')
+    assert created > newest
+    client.post(f'/demand/{created}/status', data={'status': 'CONCLUIDO'})
+    assert archive_all(app) == 1
+
+    with app.app_context():
+        archived_ids = set(alfa.db.session.scalars(alfa.db.select(alfa.ArchivedDemand.id)))
+        assert {completed, created} <= archived_ids
+        entity = alfa.completed_demands_entity()
+        ids = alfa.db.session.scalars(alfa.db.select(entity.id)).all()
+        assert len(ids) == len(set(ids))
+        for model in (alfa.ArchivedDemandLog, alfa.ArchivedDemandStatusTransition):
+            demand_ids = set(alfa.db.session.scalars(alfa.db.select(model.demand_id)))
+            assert {completed, created} <= demand_ids
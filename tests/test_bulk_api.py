@@ -0,0 +1,19 @@
+"""
+Ações em lote da API: "ids" só como lista de inteiros JSON; qualquer outra
+coisa é 400, sem tocar em nenhuma demanda.
+"""
+import pytest
+
+
+@pytest.mark.parametrize('ids', ['12', [True], [1.9], ['3'], {'id': 1}])
+def test_bulk_status_rejects_ids_that_are_not_integers(login, ids):
+    client = login('gerente')
+    response = client.post('/api/v1/demands/bulk/status', json={'status': 'PARADO', 'ids': ids})
+    assert response.status_code == 400
+    assert '"ids"' in response.json['error']
+
+
+def test_bulk_status_accepts_integer_ids(login):
+    client = login('gerente')
+    response = client.post('/api/v1/demands/bulk/status', json={'status': 'PARADO', 'ids': [999999]})
+    assert response.status_code == 200 and response.json['count'] == 0
@@ -0,0 +1,44 @@
+"""
+A validação da importação barra antes do INSERT o que o banco recusaria: no
+PostgreSQL um valor fora do tipo da coluna derrubaria o lote inteiro.
+"""
+from decimal import Decimal
+
+import pytest
+
+import app as alfa
+
+
+def sale(**fields):
+    return dict({'external_os_number': 'IMP1', 'technician': 'tecnico', 'service_type': 'Venda',
+                 'sale_items': ['Cabo'], 'commission_value': '10'}, **fields)
+
+
+@pytest.fixture
+def importer(app):
+    with app.app_context():
+        yield alfa.CommissionImporter()
+
+
+@pytest.mark.parametrize('record', [
+    sale(commission_value='Infinity'),
+    sale(commission_value=float('inf')),
+    sale(commission_value='NaN'),
+    sale(commission_value='-1'),
+    sale(commission_value='100000000'),
+    sale(commission_value='99999999.996'),
+    sale(external_os_number='9' * 51),
+    sale(status='x' * 51),
+    {'external_os_number': 'IMP2', 'technician': 'tecnico', 'service_type': 'Serviço',
+     'services': [], 'custom_services': ['Avulso:99999999999']},
+])
+def test_parse_rejects_values_the_columns_cannot_hold(importer, record):
+    if record['service_type'] == 'Serviço':
+        record['services'] = [alfa.reference_data.services()[0].name]
+    with pytest.raises(ValueError):
+        importer.parse(record)
+
+
+def test_parse_accepts_the_largest_value(importer):
+    task = importer.parse(sale(commission_value='99999999,99', external_os_number='9' * 50))['task']
+    assert task['commission_value'] == Decimal('99999999.99') and task['total_weight'] == 200000
@@ -0,0 +1,74 @@
+"""
+Importação e exportação em segundo plano: os arquivos ficam no banco, em pedaços
+de JOB_FILE_CHUNK_SIZE (job_file_chunks), gravados e lidos um por vez.
+"""
+import io
+import json
+import threading
+
+import app as alfa
+
+
+def run_worker():
+    alfa.work_jobs('teste', threading.Event(), 0, burst=True)
+
+
+def stored_files(app):
+    with app.app_context():
+        return {row.kind: row for row in alfa.JobFile.query.all()}
+
+
+def chunk_sizes(app, file_id):
+    with app.app_context():
+        return alfa.db.session.scalars(alfa.db.select(alfa.func.length(alfa.JobFileChunk.data))
+                                       .where(alfa.JobFileChunk.file_id == file_id).order_by(alfa.JobFileChunk.seq)).all()
+
+
+def test_async_import_reads_upload_from_chunks(app, login, monkeypatch):
+    # Pedaços pequenos: o arquivo enviado ocupa várias linhas e um registro cruza a divisa
+    monkeypatch.setattr(alfa, 'JOB_FILE_CHUNK_SIZE', 64)
+    client = login('gerente')
+    records = [{'external_os_number': f'JOB{number}', 'technician': 'tecnico', 'service_type': 'Venda',
+                'sale_items': ['Cabo'], 'commission_value': '10'} for number in range(3)]
+    content = json.dumps(records).encode()
+    response = client.post('/commission-tasks/import', data={
+        'async': '1', 'file': (io.BytesIO(content), 'servicos.json')})
+    assert response.status_code == 202
+    job = response.json
+
+    upload = stored_files(app)['entrada']
+    sizes = chunk_sizes(app, upload.id)
+    assert len(sizes) > 1 and set(sizes[:-1]) == {64}
+    assert sum(sizes) == upload.size == len(content)
+
+    run_worker()
+    status = client.get(job['status_url']).json
+    assert status['status'] == 'concluido'
+    assert status['result']['imported'] == 3 and status['result']['failed'] == 0
+    # O arquivo enviado é apagado depois da importação
+    assert 'entrada' not in stored_files(app) and chunk_sizes(app, upload.id) == []
+
+
+def test_async_export_streams_file_from_chunks(app, login):
+    client = login('gerente')
+    response = client.post('/commission-tasks/export', data={'format': 'csv'})
+    assert response.status_code == 202
+    job = response.json
+
+    run_worker()
+    status = client.get(job['status_url']).json
+    assert status['status'] == 'concluido' and status['file_url']
+    output = stored_files(app)['saida']
+    assert sum(chunk_sizes(app, output.id)) == output.size == status['result']['size']
+
+    download = client.get(status['file_url'])
+    assert download.status_code == 200 and download.is_streamed
+    assert int(download.headers['Content-Length']) == output.size
+    body = download.get_data().decode('utf-8-sig')
+    assert body.count('\n') == status['result']['rows'] + 1
+    assert 'attachment' in download.headers['Content-Disposition']
+    download.close()
+
+    with app.app_context():
+        assert alfa.purge_finished_jobs(-1) >= 1
+        assert alfa.db.session.scalar(alfa.db.select(alfa.func.count()).select_from(alfa.JobFileChunk)) == 0
@@ -0,0 +1,55 @@
+"""
+As listagens carregam relacionamentos com joinedload/selectinload: o número de
+consultas por página não pode crescer com o número de linhas exibidas.
+"""
+import pytest
+from sqlalchemy import event
+
+import app as alfa
+
+# Cada listagem filtrada pelo técnico do teste, para as linhas contadas serem só as criadas nele
+LISTINGS = {'/commission-tasks': 'technician_id', '/dashboard': 'assigned_to_id', '/completed-demands': 'assigned_to_id'}
+
+
+def count_statements(client, path):
+    client.get(path)  # aquece os caches (usuário, fragmentos, dados de referência)
+    statements = []
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    with alfa.app.app_context():
+        engine = alfa.db.engine
+    event.listen(engine, 'before_cursor_execute', count)
+    try:
+        response = client.get(path)
+    finally:
+        event.remove(engine, 'before_cursor_execute', count)
+    assert response.status_code == 200
+    return len(statements)
+
+
+def add_rows(client, technician_id, count):
+    """Cria `count` demandas atribuídas (metade concluída) e `count` serviços com itens avulsos."""
+    for number in range(count):
+        client.post('/demand/create', data={'title': f'Demanda {number}', 'description': 'Teste', 'priority': 'Normal'})
+        with alfa.app.app_context():
+            demand_id = alfa.db.session.scalar(alfa.db.select(alfa.func.max(alfa.Demand.id)))
+        client.post(f'/demand/{demand_id}/assign', data={'user_id': str(technician_id)})
+        if number % 2:
+            client.post(f'/demand/{demand_id}/status', data={'status': 'CONCLUIDO'})
+        client.post('/commission-tasks/create', data={
+            'external_os_number': f'LQ{number}', 'technician_id': str(technician_id), 'service_type': 'Serviço',
+            'predefined_services': ['1', '2'], 'custom_service_name': ['Extra'], 'custom_service_weight': ['2'],
+        })
+
+
+@pytest.mark.parametrize('mode, technician', [('offset', 'tecnico'), ('cursor', 'tecnico2')])
+def test_listing_query_count_does_not_depend_on_rows(login, user_id, mode, technician):
+    client = login('gerente')
+    technician_id = user_id(technician)
+    paths = [f'{path}?mode={mode}&{param}={technician_id}' for path, param in LISTINGS.items()]
+    add_rows(client, technician_id, 2)
+    few = {path: count_statements(client, path) for path in paths}
+    # Páginas cheias (PAGINATION_ITEMS linhas em cada listagem)
+    add_rows(client, technician_id, 2 * alfa.PAGINATION_ITEMS)
+    full = {path: count_statements(client, path) for path in paths}
+    assert full == few
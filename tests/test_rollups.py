@@ -0,0 +1,58 @@
+"""
+Consolidados diários: uma linha por chave (índice único), deltas somados com
+INSERT ... ON CONFLICT.
+"""
+from datetime import date, datetime
+from decimal import Decimal
+
+import app as alfa
+
+
+def rollup_rows(model, day):
+    return alfa.db.session.scalars(alfa.db.select(model).where(model.day == day)).all()
+
+
+def test_deltas_accumulate_on_the_same_row(app, user_id):
+    day = date(2001, 2, 3)
+    technician = user_id('tecnico')
+    with app.app_context():
+        for _ in range(2):
+            with alfa.db.engine.begin() as connection:
+                alfa.write_rollup_deltas(connection, {
+                    ('task', day, technician, 'Venda'): [1, 4, Decimal('2.50')],
+                    # Transição sem usuário: user_id nulo também tem uma linha só
+                    ('demand', day, None, 'PENDENTE'): [1],
+                })
+
+        tasks = rollup_rows(alfa.DailyTaskRollup, day)
+        assert [(row.task_count, row.total_weight, row.commission_value) for row in tasks] == [(2, 8, Decimal('5.00'))]
+        demands = rollup_rows(alfa.DailyDemandRollup, day)
+        assert [(row.user_id, row.transitions) for row in demands] == [(None, 2)]
+
+
+def test_tasks_count_on_the_local_day(app, user_id):
+    # 01:30 UTC de 1º de março de 2003 ainda é 28 de fevereiro em Brasília
+    technician = user_id('tecnico2')
+    with app.app_context():
+        alfa.db.session.add(alfa.CommissionTask(external_os_number='FUSO1', service_type='Serviço', technician_id=technician,
+                                                commission_value=Decimal('7'), date_completed=datetime(2003, 3, 1, 1, 30)))
+        alfa.db.session.commit()
+        incremental = [(row.day, row.task_count) for row in rollup_rows(alfa.DailyTaskRollup, date(2003, 2, 28))]
+        assert incremental == [(date(2003, 2, 28), 1)]
+        assert rollup_rows(alfa.DailyTaskRollup, date(2003, 3, 1)) == []
+
+        with alfa.db.engine.begin() as connection:
+            alfa.rebuild_rollups(connection, date(2003, 2, 28), date(2003, 3, 1))
+        alfa.db.session.expire_all()
+        assert [(row.day, row.task_count) for row in rollup_rows(alfa.DailyTaskRollup, date(2003, 2, 28))] == incremental
+        assert rollup_rows(alfa.DailyTaskRollup, date(2003, 3, 1)) == []
+
+
+def test_rebuild_command_changes_table_versions(app):
+    with app.app_context():
+        before = alfa.table_versions(['commission_tasks', 'demands'])
+    result = app.test_cli_runner().invoke(args=['rebuild-rollups'])
+    assert 'Consolidados reconstruídos' in result.output
+    with app.app_context():
+        after = alfa.table_versions(['commission_tasks', 'demands'])
+    assert all(after[name][0] == before[name][0] + 1 for name in after)
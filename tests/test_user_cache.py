@@ -0,0 +1,43 @@
+"""
+A identidade em cache (user_cache) acompanha alterações em users feitas por
+outro processo (CLI, outro worker), mesmo sem CACHE_SHARED_URL.
+"""
+import pytest
+
+import app as alfa
+
+
+@pytest.fixture
+def other_process(app, monkeypatch):
+    """Grava em users como outro processo: sem os eventos da sessão deste, só o contador no banco."""
+    monkeypatch.setattr(alfa.reference_data, 'check_interval', 0)
+    def write(user_id, **values):
+        with app.app_context():
+            with alfa.db.engine.begin() as connection:
+                table = alfa.User.__table__
+                connection.execute(table.update().where(table.c.id == user_id).values(**values))
+                alfa.bump_reference_version(connection)
+    return write
+
+
+def test_role_change_from_other_process_is_seen(login, user_id, other_process):
+    client = login('tecnico2')
+    assert client.get('/reports/productivity').status_code == 302
+    other_process(user_id('tecnico2'), role='Gerente')
+    try:
+        assert client.get('/reports/productivity').status_code == 200
+    finally:
+        other_process(user_id('tecnico2'), role='Técnico')
+
+
+def test_password_change_from_other_process_ends_session(login, user_id, other_process):
+    client = login('tecnico2')
+    assert client.get('/dashboard').status_code == 200
+    with alfa.app.app_context():
+        old_hash = alfa.db.session.get(alfa.User, user_id('tecnico2')).password_hash
+    other_process(user_id('tecnico2'), password_hash=alfa.hash_password('outra-senha'))
+    try:
+        response = client.get('/dashboard')
+        assert response.status_code == 302 and '/dashboard' not in response.location
+    finally:
+        other_process(user_id('tecnico2'), password_hash=old_hash)